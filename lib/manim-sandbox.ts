@@ -7,6 +7,7 @@ const workerUrl = process.env.MANIM_WORKER_URL ?? 'http://127.0.0.1:8001'
 interface ManimExecutionOptions {
   timeout?: number
   quality?: 'low' | 'medium' | 'high'
+  renderer?: 'cairo' | 'opengl'
   additionalPackages?: string[]
 }
 
@@ -23,11 +24,16 @@ interface WorkerJob {
   id: string
   status: WorkerJobStatus
   quality: 'low' | 'medium' | 'high'
+  renderer: 'cairo' | 'opengl'
   additional_packages: string[]
   stdout_log: string
   stderr_log: string
+  stdout_log_path: string | null
+  stderr_log_path: string | null
   output_path: string | null
   error_message: string | null
+  completed_at: string | null
+  updated_at: string | null
 }
 
 async function sleep(ms: number) {
@@ -51,6 +57,7 @@ export async function executeManimCode(
   const {
     timeout = DEFAULT_TIMEOUT_MS,
     quality = 'medium',
+    renderer,
     additionalPackages = [],
   } = options
 
@@ -67,6 +74,7 @@ export async function executeManimCode(
     body: JSON.stringify({
       python_code: pythonCode,
       quality,
+      renderer,
       additional_packages: additionalPackages,
     }),
   })
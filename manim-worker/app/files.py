@@ -0,0 +1,55 @@
+"""Moving finished videos out of the per-job working dirs."""
+import errno
+import os
+import shutil
+from pathlib import Path
+
+COPY_BUFFER_SIZE = 16 * 1024 * 1024
+UNSUPPORTED_COPY_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+
+
+def _copy_in_kernel(copy, src_fd: int, dst_fd: int, remaining: int) -> int:
+    """Copy with copy_file_range or sendfile from the current offsets; returns bytes left."""
+    while remaining > 0:
+        copied = copy(src_fd, dst_fd, remaining)
+        if copied == 0:
+            break
+        remaining -= copied
+    return remaining
+
+
+def copy_video(source: Path, destination: Path) -> None:
+    """Copy file data only (no metadata), in the kernel wherever possible.
+
+    copy_file_range is tried first; kernels 5.19+ reject it with EXDEV between different
+    filesystem types (tmpfs -> ext4), so sendfile is the next in-kernel option. A
+    user-space copy is only used when neither is supported.
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        copiers = [getattr(os, "copy_file_range", None)]
+        if hasattr(os, "sendfile"):
+            copiers.append(lambda in_fd, out_fd, count: os.sendfile(out_fd, in_fd, None, count))
+        for copy in copiers:
+            if copy is None or remaining <= 0:
+                continue
+            try:
+                remaining = _copy_in_kernel(copy, src_fd, dst_fd, remaining)
+            except OSError as exc:
+                if exc.errno not in UNSUPPORTED_COPY_ERRNOS:
+                    raise
+                # Both calls advance the shared offsets, so a fallback resumes where this stopped.
+                remaining = os.fstat(src_fd).st_size - os.lseek(src_fd, 0, os.SEEK_CUR)
+        if remaining > 0:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def move_video(source: Path, destination: Path) -> None:
+    """Move the rendered video out of the working dir, copying only across filesystems."""
+    try:
+        os.replace(source, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        copy_video(source, destination)
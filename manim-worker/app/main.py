@@ -1,19 +1,26 @@
 import asyncio
+import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import uuid
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_fixed
+from pydantic import BaseModel, Field, field_validator
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_fixed
+
+from app.files import move_video
+from app.render_pool import RenderPool, kill_process_group
+from app.validation import check_scene_code
 
 # Configure logging
 logging.basicConfig(
@@ -28,13 +35,92 @@ OUTPUT_DIR = Path(os.environ.get("MANIM_OUTPUT_DIR", Path.cwd() / "outputs")).re
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 logger.info(f"Manim Worker starting - Output directory: {OUTPUT_DIR}")
 
+# Job working dirs hold manim's intermediate frames and partial movies; keep them in
+# memory-backed storage when available so only the final MP4 touches disk.
+WORK_ROOT = os.environ.get("MANIM_WORK_ROOT") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
+# Jobs keep only the tail of their logs in memory; the full output stays in the log files.
+LOG_TAIL_BYTES = max(0, int(os.environ.get("MANIM_LOG_TAIL_BYTES", 64 * 1024)))
+FFMPEG_BINARY = shutil.which("ffmpeg") or "ffmpeg"
+BASE_ENV = {"FFMPEG_BINARY": FFMPEG_BINARY, **os.environ}
+JOB_TTL_SECONDS = int(os.environ.get("MANIM_JOB_TTL_SECONDS", 24 * 60 * 60))
+GC_INTERVAL_SECONDS = 60
+# When set (e.g. "/protected"), videos are served by a fronting nginx via X-Accel-Redirect
+# instead of being streamed through Python.
+ACCEL_REDIRECT_PREFIX = os.environ.get("MANIM_ACCEL_REDIRECT_PREFIX")
+# The OpenGL renderer needs a GPU with a headless EGL context; opt in per deployment.
+OPENGL_AVAILABLE = os.environ.get("MANIM_ENABLE_OPENGL", "").lower() in ("1", "true", "yes")
+# Manim CLI flag and the resolution subdirectory it renders into, per quality preset.
+QUALITY_PRESETS = {
+    "low": ("-ql", "480p15"),
+    "medium": ("-qm", "720p30"),
+    "high": ("-qh", "1080p60"),
+}
+# Wall-clock budget per render; runaway scenes are killed so they cannot hold a worker forever.
+RENDER_TIMEOUT_SECONDS = {
+    "low": 60,
+    "medium": 300,
+    "high": 900,
+}
+# Same idea for installing additional_packages (all retries together), e.g. an sdist whose build hangs.
+PACKAGE_INSTALL_TIMEOUT_SECONDS = 300
+MAX_CONCURRENT_RENDERS = max(1, int(os.environ.get("MANIM_MAX_CONCURRENCY", os.cpu_count() or 2)))
+# When set, job state and the dispatch queue live in Redis so several worker replicas can
+# share them and they survive restarts; otherwise both are kept in this process.
+REDIS_URL = os.environ.get("MANIM_REDIS_URL")
+REDIS_JOB_KEY_PREFIX = "job:"
+# Set of every stored job id, so the jobs can be counted and listed without a SCAN.
+REDIS_JOB_INDEX_KEY = "manim:jobs"
+REDIS_QUEUE_KEY = "manim:queue"
+# Messages a worker has taken off the queue but not finished yet; entries left behind by a
+# replica that died mid-render are moved back onto the queue by the sweeper.
+REDIS_PROCESSING_KEY = "manim:processing"
+# Atomically move one message from the processing list back to the head of the queue.
+REDIS_REQUEUE_SCRIPT = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 1 then
+    redis.call('RPUSH', KEYS[2], ARGV[1])
+    return 1
+end
+return 0
+"""
+# A taken job that has not been updated for this long has lost its worker.
+STALE_JOB_SECONDS = 2 * (PACKAGE_INSTALL_TIMEOUT_SECONDS + max(RENDER_TIMEOUT_SECONDS.values()))
+# One render worker per allowed concurrent render, so the worker count is the limit; this
+# only tracks which jobs are in progress for /health.
+active_jobs: Set[str] = set()
+render_workers: List[asyncio.Task] = []
+gc_task: Optional[asyncio.Task] = None
+
 app = FastAPI(title="Manim Worker", version="0.1.0")
 
 @app.on_event("startup")
 async def startup_event():
+    global gc_task
+    await job_store.start()
+    gc_task = asyncio.create_task(gc_loop())
+    render_workers.extend(
+        asyncio.create_task(render_worker(worker_id)) for worker_id in range(MAX_CONCURRENT_RENDERS)
+    )
+    work_dir_pool.start()
+    await render_pool.start()
     logger.info("Manim Worker API started successfully")
     logger.info(f"Environment: PORT={os.environ.get('PORT', 'not set')}")
-    logger.info(f"Total jobs in memory: {len(jobs)}")
+    logger.info(f"Job store: {'redis' if REDIS_URL else 'memory'}")
+    logger.info(f"Render workers started: {MAX_CONCURRENT_RENDERS}")
+    logger.info(f"Job working directories: {work_dir_pool.root}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if gc_task:
+        gc_task.cancel()
+    for worker in render_workers:
+        worker.cancel()
+    await asyncio.gather(*render_workers, return_exceptions=True)
+    render_workers.clear()
+    await render_pool.stop()
+    await work_dir_pool.stop()
+    await job_store.stop()
+    logger.info("Manim Worker API stopped")
 
 
 class JobStatus(str, Enum):
@@ -48,138 +134,602 @@ class CreateJobRequest(BaseModel):
     python_code: str = Field(..., min_length=1, max_length=50_000)
     quality: str = Field("medium", pattern="^(low|medium|high)$")
     additional_packages: Optional[List[str]] = Field(default=None, max_length=10)
+    renderer: Optional[str] = Field(default=None, pattern="^(cairo|opengl)$")
 
+    @field_validator("python_code")
+    @classmethod
+    def validate_python_code(cls, value: str) -> str:
+        check_scene_code(value)
+        return value
 
-class Job(BaseModel):
+
+class JobSummary(BaseModel):
     id: str
     status: JobStatus
     quality: str
+    renderer: str = "cairo"
     additional_packages: List[str]
-    stdout_log: str = ""
-    stderr_log: str = ""
+    stdout_log_path: Optional[str] = None
+    stderr_log_path: Optional[str] = None
     output_path: Optional[str] = None
     error_message: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class Job(JobSummary):
+    stdout_log: str = ""
+    stderr_log: str = ""
 
 
-jobs_lock = asyncio.Lock()
-jobs: Dict[str, Job] = {}
+class MemoryJobStore:
+    """Jobs and the dispatch queue kept in this process; lost on restart."""
 
+    def __init__(self):
+        # Only touched from the event loop, and every access is a single dict operation,
+        # so no lock is needed.
+        self.jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
 
-def quality_flag(quality: str) -> str:
-    flags = {
-        "low": "-ql",
-        "medium": "-qm",
-        "high": "-qh",
-    }
-    return flags[quality]
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+
+    async def stop(self) -> None:
+        pass
+
+    async def save(self, job: Job) -> None:
+        job.updated_at = datetime.now(timezone.utc)
+        self.jobs[job.id] = job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    async def summaries(self) -> List[JobSummary]:
+        return list(self.jobs.values())
+
+    async def count(self) -> int:
+        return len(self.jobs)
+
+    async def delete(self, job_id: str) -> None:
+        self.jobs.pop(job_id, None)
+
+    async def enqueue(self, job_id: str, request: CreateJobRequest) -> None:
+        self._queue.put_nowait((job_id, request))
 
+    async def dequeue(self) -> Tuple[str, CreateJobRequest]:
+        return await self._queue.get()
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
-def pip_install(packages: List[str], cwd: Path) -> subprocess.CompletedProcess:
+    async def ack(self, job_id: str) -> None:
+        pass
+
+    async def requeue(self, job_id: str, request: CreateJobRequest) -> None:
+        self._queue.put_nowait((job_id, request))
+
+    async def requeue_stale(self, cutoff: datetime) -> int:
+        # Nothing outlives this process, so no other worker can have abandoned a job.
+        return 0
+
+    async def queue_size(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+
+class RedisJobStore:
+    """Jobs as Redis hashes (job:<id>) and a Redis list as the queue, shared by all replicas."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis  # pylint: disable=import-outside-toplevel
+
+        self.redis = redis.from_url(url, decode_responses=True)
+        self._requeue = self.redis.register_script(REDIS_REQUEUE_SCRIPT)
+        # Processing-list payloads of the jobs this replica is working on, by job id.
+        self._in_flight: Dict[str, str] = {}
+
+    async def start(self) -> None:
+        await self.redis.ping()
+
+    async def stop(self) -> None:
+        await self.redis.aclose()
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{REDIS_JOB_KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def _load(fields: Dict[str, Optional[str]], model: type = Job):
+        fields = {name: value for name, value in fields.items() if value is not None}
+        if not fields:
+            return None
+        return model.model_validate({name: json.loads(value) for name, value in fields.items()})
+
+    async def save(self, job: Job) -> None:
+        job.updated_at = datetime.now(timezone.utc)
+        fields = {name: json.dumps(value) for name, value in job.model_dump(mode="json").items()}
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job.id), mapping=fields)
+            pipe.sadd(REDIS_JOB_INDEX_KEY, job.id)
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return self._load(await self.redis.hgetall(self._key(job_id)))
+
+    async def summaries(self) -> List[JobSummary]:
+        """Every job without its log tails, which make up most of each hash."""
+        job_ids = await self.redis.smembers(REDIS_JOB_INDEX_KEY)
+        if not job_ids:
+            return []
+        names = list(JobSummary.model_fields)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hmget(self._key(job_id), names)
+            results = await pipe.execute()
+        summaries = (self._load(dict(zip(names, values)), JobSummary) for values in results)
+        return [summary for summary in summaries if summary]
+
+    async def count(self) -> int:
+        return await self.redis.scard(REDIS_JOB_INDEX_KEY)
+
+    async def delete(self, job_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(job_id))
+            pipe.srem(REDIS_JOB_INDEX_KEY, job_id)
+            await pipe.execute()
+
+    async def enqueue(self, job_id: str, request: CreateJobRequest) -> None:
+        await self.redis.lpush(REDIS_QUEUE_KEY, json.dumps({"job_id": job_id, "request": request.model_dump()}))
+
+    async def dequeue(self) -> Tuple[str, CreateJobRequest]:
+        # BLMOVE rather than BRPOP, so a job stays on record until it is acked or requeued.
+        payload = None
+        while payload is None:
+            payload = await self.redis.blmove(REDIS_QUEUE_KEY, REDIS_PROCESSING_KEY, 5, src="RIGHT", dest="LEFT")
+        message = json.loads(payload)
+        self._in_flight[message["job_id"]] = payload
+        return message["job_id"], CreateJobRequest.model_validate(message["request"])
+
+    async def ack(self, job_id: str) -> None:
+        payload = self._in_flight.pop(job_id, None)
+        if payload is not None:
+            await self.redis.lrem(REDIS_PROCESSING_KEY, 1, payload)
+
+    async def requeue(self, job_id: str, request: CreateJobRequest) -> None:
+        payload = self._in_flight.pop(job_id, None)
+        if payload is not None:
+            await self._requeue(keys=[REDIS_PROCESSING_KEY, REDIS_QUEUE_KEY], args=[payload])
+
+    async def requeue_stale(self, cutoff: datetime) -> int:
+        """Put jobs taken by another worker but not updated since cutoff back on the queue."""
+        requeued = 0
+        own = set(self._in_flight.values())
+        for payload in await self.redis.lrange(REDIS_PROCESSING_KEY, 0, -1):
+            if payload in own:
+                continue
+            job = await self.get(json.loads(payload)["job_id"])
+            if job is None:
+                await self.redis.lrem(REDIS_PROCESSING_KEY, 1, payload)
+                continue
+            if job.updated_at and job.updated_at >= cutoff:
+                continue
+            # Only the replica whose LREM succeeds requeues it, so it is never queued twice.
+            if await self._requeue(keys=[REDIS_PROCESSING_KEY, REDIS_QUEUE_KEY], args=[payload]):
+                job.status = JobStatus.PENDING
+                await self.save(job)
+                requeued += 1
+        return requeued
+
+    async def queue_size(self) -> int:
+        return await self.redis.llen(REDIS_QUEUE_KEY)
+
+
+job_store = RedisJobStore(REDIS_URL) if REDIS_URL else MemoryJobStore()
+
+
+def select_renderer(request: CreateJobRequest) -> str:
+    """Use OpenGL for high quality (or when asked) if this host supports it, else cairo."""
+    renderer = request.renderer or ("opengl" if request.quality == "high" else "cairo")
+    if renderer == "opengl" and not OPENGL_AVAILABLE:
+        return "cairo"
+    return renderer
+
+
+async def run_logged(args: List[str], job: Job, timeout: float, **kwargs) -> subprocess.CompletedProcess:
+    """Run a subprocess in its own session with stdout/stderr appended to the job's log files.
+
+    Raises asyncio.TimeoutError after killing its whole process group (e.g. a build spawned
+    by uv) once timeout expires, and kills it the same way when cancelled.
+    """
+    with open(job.stdout_log_path, "ab") as stdout_file, open(job.stderr_log_path, "ab") as stderr_file:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=subprocess.DEVNULL,
+            stdout=stdout_file,
+            stderr=stderr_file,
+            start_new_session=True,
+            **kwargs,
+        )
+    try:
+        returncode = await asyncio.wait_for(process.wait(), timeout)
+    except BaseException:
+        await kill_process_group(process.pid)
+        raise
+    return subprocess.CompletedProcess(args, returncode)
+
+
+async def pip_install(packages: List[str], job: Job, cwd: Path, target: Path) -> subprocess.CompletedProcess:
+    """Install packages into a per-job target dir with uv, reusing uv's shared wheel cache."""
     logger.info(f"Installing packages: {packages}")
-    return subprocess.run(
-        ["python", "-m", "pip", "install", "--no-cache-dir", *packages],
-        cwd=cwd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=True,
-    )
+    args = [
+        sys.executable,
+        "-m",
+        "uv",
+        "pip",
+        "install",
+        "--python",
+        sys.executable,
+        "--target",
+        str(target),
+        *packages,
+    ]
+    # One wall-clock budget for all attempts, so a build that never finishes cannot hold a slot.
+    deadline = time.monotonic() + PACKAGE_INSTALL_TIMEOUT_SECONDS
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(1),
+        retry=retry_if_exception_type(subprocess.CalledProcessError),
+        reraise=True,
+    ):
+        with attempt:
+            result = await run_logged(args, job, max(0.0, deadline - time.monotonic()), cwd=cwd)
+            result.check_returncode()
+    return result
+
+
+render_pool = RenderPool(MAX_CONCURRENT_RENDERS, BASE_ENV)
+
+
+def installed_modules(target: Path) -> Set[str]:
+    """Top-level importable names that pip placed in a --target dir."""
+    names: Set[str] = set()
+    try:
+        entries = list(os.scandir(target))
+    except FileNotFoundError:
+        return names
+    for entry in entries:
+        if entry.is_dir():
+            if entry.name.isidentifier() and entry.name not in ("__pycache__", "bin"):
+                names.add(entry.name)
+        elif entry.name.endswith((".py", ".so", ".pyd")):
+            names.add(entry.name.split(".", 1)[0])
+    return names
+
+
+async def render_in_fresh_interpreter(args: List[str], job: Job, timeout: float, **kwargs) -> int:
+    """Run manim in a new interpreter; raises asyncio.TimeoutError after killing it."""
+    return (await run_logged([sys.executable, "-m", "manim", *args], job, timeout, **kwargs)).returncode
+
+
+def log_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
 
 
-def run_manim(job: Job, request: CreateJobRequest, working_dir: Path) -> Job:
+def read_log(path: str, offset: int = 0) -> str:
+    """Return at most the last LOG_TAIL_BYTES of a log file written after offset."""
+    try:
+        with open(path, "rb") as log_file:
+            log_file.seek(max(offset, os.fstat(log_file.fileno()).st_size - LOG_TAIL_BYTES))
+            return log_file.read().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return ""
+
+
+def refresh_log_tails(job: Job) -> None:
+    job.stdout_log = read_log(job.stdout_log_path)
+    job.stderr_log = read_log(job.stderr_log_path)
+
+
+async def run_manim(job: Job, request: CreateJobRequest, working_dir: Path) -> Job:
     logger.info(f"Starting Manim rendering for job {job.id} with quality: {request.quality}")
     quality = request.quality
-    render_flag = quality_flag(quality)
+    render_flag, resolution_dir = QUALITY_PRESETS[quality]
 
     script_path = working_dir / "scene.py"
+    media_dir = working_dir / "media"
     script_path.write_text(request.python_code, encoding="utf-8")
     logger.info(f"Job {job.id}: Script written to {script_path}")
 
+    python_path = [str(working_dir)]
+    fresh_interpreter = False
     if request.additional_packages:
+        packages_dir = working_dir / ".pkgs"
+        python_path.insert(0, str(packages_dir))
         try:
-            install_result = pip_install(request.additional_packages, working_dir)
-            job.stdout_log += install_result.stdout
-            job.stderr_log += install_result.stderr
-        except subprocess.CalledProcessError as exc:
-            logger.error(f"Job {job.id}: Failed to install packages - {exc.stderr}")
+            await pip_install(request.additional_packages, job, working_dir, packages_dir)
+        except subprocess.CalledProcessError:
+            refresh_log_tails(job)
+            logger.error(f"Job {job.id}: Failed to install packages - {job.stderr_log}")
             job.status = JobStatus.FAILED
-            job.stderr_log += exc.stderr
             job.error_message = "Failed to install additional packages"
             return job
+        except asyncio.TimeoutError:
+            refresh_log_tails(job)
+            logger.error(f"Job {job.id}: Package installation timed out after {PACKAGE_INSTALL_TIMEOUT_SECONDS}s")
+            job.status = JobStatus.FAILED
+            job.error_message = f"Package installation timed out after {PACKAGE_INSTALL_TIMEOUT_SECONDS}s"
+            return job
+        refresh_log_tails(job)
+        # A forked render already has the driver's imports loaded, so a package replacing
+        # one of them (say a different numpy) would silently not take effect there.
+        preloaded = render_pool.preloaded_modules
+        shadowed = installed_modules(packages_dir) & preloaded
+        if shadowed or not preloaded:
+            logger.info(f"Job {job.id}: Packages shadow preloaded modules {sorted(shadowed)}, using a fresh interpreter")
+            fresh_interpreter = True
+
+    render_args = [
+        str(script_path),
+        render_flag,
+        "--format",
+        "mp4",
+        "--renderer",
+        job.renderer,
+        "--media_dir",
+        str(media_dir),
+        "-o",
+        f"{job.id}.mp4",
+    ]
+    if job.renderer == "opengl":
+        # Without this the OpenGL renderer opens a preview window instead of writing a file.
+        render_args.append("--write_to_movie")
+
+    logger.info(f"Job {job.id}: Running Manim with quality flag {render_flag} and {job.renderer} renderer")
+    stderr_offset = log_size(job.stderr_log_path)
+    timeout = RENDER_TIMEOUT_SECONDS[quality]
+    # Job paths first, then whatever the deployment already puts on PYTHONPATH; pooled
+    # drivers have the latter in sys.path, so a fresh interpreter must keep it too.
+    if BASE_ENV.get("PYTHONPATH"):
+        python_path.append(BASE_ENV["PYTHONPATH"])
+    job_python_path = os.pathsep.join(python_path)
+    try:
+        if fresh_interpreter:
+            returncode = await render_in_fresh_interpreter(
+                render_args,
+                job,
+                timeout,
+                cwd=working_dir,
+                env={**BASE_ENV, "PYTHONPATH": job_python_path},
+            )
+        else:
+            returncode = await render_pool.submit(
+                {
+                    "args": render_args,
+                    "cwd": str(working_dir),
+                    "env": {"PYTHONPATH": job_python_path},
+                    "stdout": job.stdout_log_path,
+                    "stderr": job.stderr_log_path,
+                },
+                timeout,
+            )
+    except asyncio.TimeoutError:
+        returncode = None
+
+    refresh_log_tails(job)
+    render_stderr = read_log(job.stderr_log_path, stderr_offset)
+
+    if returncode is None:
+        logger.error(f"Job {job.id}: Manim rendering timed out after {timeout}s")
+        job.status = JobStatus.FAILED
+        job.error_message = f"Render timed out after {timeout}s"
+        return job
 
-    env = os.environ.copy()
-    env.setdefault("FFMPEG_BINARY", shutil.which("ffmpeg") or "ffmpeg")
-    env.setdefault("PYTHONPATH", str(working_dir))
-
-    logger.info(f"Job {job.id}: Running Manim with quality flag {render_flag}")
-    render_process = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "manim",
-            str(script_path),
-            render_flag,
-            "--format",
-            "mp4",
-            "--renderer",
-            "cairo",
-        ],
-        cwd=working_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        env=env,
-    )
-
-    job.stdout_log += render_process.stdout
-    job.stderr_log += render_process.stderr
-
-    if render_process.returncode != 0:
-        logger.error(f"Job {job.id}: Manim rendering failed with code {render_process.returncode}")
-        logger.error(f"Job {job.id} stderr: {render_process.stderr}")
+    if returncode != 0:
+        logger.error(f"Job {job.id}: Manim rendering failed with code {returncode}")
+        logger.error(f"Job {job.id} stderr: {render_stderr}")
         job.status = JobStatus.FAILED
         job.error_message = "Manim rendering failed"
         return job
 
-    media_dir = working_dir / "media"
-    mp4_files = list(media_dir.glob("**/*.mp4"))
-
-    if not mp4_files:
-        logger.error(f"Job {job.id}: No MP4 files generated in {media_dir}")
+    scene_videos_dir = media_dir / "videos" / script_path.stem
+    video_path = scene_videos_dir / resolution_dir / f"{job.id}.mp4"
+    if not video_path.exists():
+        # Scenes that change config.frame_rate or config.pixel_height render into another
+        # resolution dir; look one level down for our output name only.
+        video_path = next(scene_videos_dir.glob(f"*/{job.id}.mp4"), video_path)
+    if not video_path.exists():
+        logger.error(f"Job {job.id}: Expected MP4 not generated in {scene_videos_dir}")
         job.status = JobStatus.FAILED
         job.error_message = "No MP4 generated"
         return job
 
-    logger.info(f"Job {job.id}: Found {len(mp4_files)} video file(s)")
-
     output_dest = OUTPUT_DIR / f"{job.id}.mp4"
     output_dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy(mp4_files[0], output_dest)
+    await asyncio.to_thread(move_video, video_path, output_dest)
     job.output_path = str(output_dest)
     job.status = JobStatus.COMPLETED
     logger.info(f"Job {job.id}: Completed successfully - Video saved to {output_dest}")
     return job
 
 
+class WorkDirPool:
+    """Reusable job working dirs, emptied in the background between jobs."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.root: Optional[Path] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._cleanups: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        self.root = Path(tempfile.mkdtemp(prefix="manim-work-", dir=WORK_ROOT))
+        self._idle = asyncio.Queue()
+        for index in range(self.size):
+            work_dir = self.root / str(index)
+            work_dir.mkdir()
+            self._idle.put_nowait(work_dir)
+
+    async def stop(self) -> None:
+        await asyncio.gather(*self._cleanups, return_exceptions=True)
+        if self.root:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    async def acquire(self) -> Path:
+        return await self._idle.get()
+
+    def release(self, work_dir: Path) -> None:
+        task = asyncio.create_task(self._clean(work_dir))
+        self._cleanups.add(task)
+        task.add_done_callback(self._cleanups.discard)
+
+    async def _clean(self, work_dir: Path) -> None:
+        try:
+            await asyncio.to_thread(shutil.rmtree, work_dir)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            # Never hand the last job's .pkgs or media to the next one: leave the remains for
+            # stop() and put a new, empty dir in the pool instead.
+            logger.error(f"Failed to empty working dir {work_dir}, replacing it: {exc}")
+            work_dir = self.root / uuid.uuid4().hex
+        try:
+            work_dir.mkdir()
+        except OSError as exc:
+            # Never shrink the pool: the next job re-creates the dir (or fails on its own).
+            logger.error(f"Failed to create working dir {work_dir}: {exc}")
+        finally:
+            self._idle.put_nowait(work_dir)
+
+
+# Twice the worker count so a clean dir is normally waiting while the last one is emptied.
+work_dir_pool = WorkDirPool(2 * MAX_CONCURRENT_RENDERS)
+
+
 async def execute_job(job_id: str, request: CreateJobRequest) -> None:
-    tmp_dir = Path(tempfile.mkdtemp(prefix="manim-job-"))
-    logger.info(f"Job {job_id}: Starting execution in {tmp_dir}")
-    async with jobs_lock:
-        job = jobs[job_id]
-        job.status = JobStatus.RUNNING
+    job = await job_store.get(job_id)
+    if not job:
+        logger.warning(f"Job {job_id}: Dequeued but no longer tracked, skipping")
+        return
+    # Refresh updated_at so no sweeper mistakes the job for one abandoned in the queue.
+    await job_store.save(job)
+    tmp_dir: Optional[Path] = None
     try:
-        updated_job = run_manim(job, request, tmp_dir)
+        tmp_dir = await work_dir_pool.acquire()
+        job.status = JobStatus.RUNNING
+        await job_store.save(job)
+        logger.info(f"Job {job_id}: Starting execution in {tmp_dir}")
+        tmp_dir.mkdir(exist_ok=True)
+        await run_manim(job, request, tmp_dir)
+    except asyncio.CancelledError:
+        # Shutting down mid-job: hand it back to the queue instead of leaving it "running".
+        logger.warning(f"Job {job_id}: Interrupted, returning it to the queue")
+        job.status = JobStatus.PENDING
+        await job_store.save(job)
+        await job_store.requeue(job_id, request)
+        raise
     except Exception as exc:  # pylint: disable=broad-exception-caught
         logger.exception(f"Job {job_id}: Unexpected error - {exc}")
-        updated_job = job
-        updated_job.status = JobStatus.FAILED
-        updated_job.error_message = str(exc)
+        job.status = JobStatus.FAILED
+        job.error_message = str(exc)
     finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if tmp_dir is not None:
+            work_dir_pool.release(tmp_dir)
+
+    job.completed_at = datetime.now(timezone.utc)
+    await job_store.save(job)
 
-    async with jobs_lock:
-        jobs[job_id] = updated_job
+
+def remove_file(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def remove_job_files(jobs: List[JobSummary]) -> None:
+    for job in jobs:
+        for path in (job.output_path, job.stdout_log_path, job.stderr_log_path):
+            remove_file(path)
+
+
+def remove_orphaned_files(live_ids: Set[str], cutoff: float) -> int:
+    """Delete files in OUTPUT_DIR older than cutoff that belong to no tracked job."""
+    orphaned = 0
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            if entry.name.split(".", 1)[0] in live_ids or not entry.is_file():
+                continue
+            if entry.stat().st_mtime < cutoff:
+                remove_file(entry.path)
+                orphaned += 1
+    return orphaned
+
+
+async def sweep_expired_jobs() -> None:
+    """Forget jobs finished more than JOB_TTL_SECONDS ago and delete their files."""
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(seconds=JOB_TTL_SECONDS)
+    stale_cutoff = now - timedelta(seconds=STALE_JOB_SECONDS)
+    requeued = await job_store.requeue_stale(stale_cutoff)
+    tracked = await job_store.summaries()
+    # Running jobs nobody has touched in longer than any render can take lost their worker
+    # without a queue entry to retry from; fail them so clients stop polling and they expire.
+    abandoned = [
+        summary
+        for summary in tracked
+        if summary.status == JobStatus.RUNNING and (summary.updated_at is None or summary.updated_at < stale_cutoff)
+    ]
+    for summary in abandoned:
+        job = await job_store.get(summary.id)
+        if job is None:
+            continue
+        job.status = summary.status = JobStatus.FAILED
+        job.error_message = "Worker stopped before the job finished"
+        job.completed_at = summary.completed_at = now
+        await job_store.save(job)
+    expired = [job for job in tracked if job.completed_at and job.completed_at < cutoff]
+    for job in expired:
+        await job_store.delete(job.id)
+    # OUTPUT_DIR may be network storage, so keep its scans and unlinks off the event loop.
+    await asyncio.to_thread(remove_job_files, expired)
+
+    # Files left behind by jobs the store no longer tracks (e.g. from before a restart).
+    live_ids = {job.id for job in tracked} - {job.id for job in expired}
+    orphaned = await asyncio.to_thread(remove_orphaned_files, live_ids, cutoff.timestamp())
+
+    if requeued or abandoned:
+        logger.warning(f"Garbage collection: requeued {requeued} and failed {len(abandoned)} abandoned job(s)")
+    if expired or orphaned:
+        logger.info(f"Garbage collection: removed {len(expired)} expired job(s) and {orphaned} orphaned file(s)")
+
+
+async def gc_loop() -> None:
+    while True:
+        await asyncio.sleep(GC_INTERVAL_SECONDS)
+        try:
+            await sweep_expired_jobs()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Garbage collection failed - {exc}")
+
+
+async def render_worker(worker_id: int) -> None:
+    logger.info(f"Render worker {worker_id}: Waiting for jobs")
+    while True:
+        try:
+            job_id, request = await job_store.dequeue()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Render worker {worker_id}: Failed to fetch next job - {exc}")
+            await asyncio.sleep(1)
+            continue
+        active_jobs.add(job_id)
+        try:
+            await execute_job(job_id, request)
+            await job_store.ack(job_id)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Render worker {worker_id}: Job {job_id} crashed - {exc}")
+        finally:
+            active_jobs.discard(job_id)
 
 
 @app.post("/jobs", response_model=Job, status_code=201)
@@ -190,26 +740,25 @@ async def create_job(payload: CreateJobRequest):
         id=job_id,
         status=JobStatus.PENDING,
         quality=payload.quality,
+        renderer=select_renderer(payload),
         additional_packages=payload.additional_packages or [],
+        stdout_log_path=str(OUTPUT_DIR / f"{job_id}.stdout.log"),
+        stderr_log_path=str(OUTPUT_DIR / f"{job_id}.stderr.log"),
     )
-    async with jobs_lock:
-        jobs[job_id] = job
-
-    asyncio.create_task(execute_job(job_id, payload))
+    await job_store.save(job)
+    await job_store.enqueue(job_id, payload)
     logger.info(f"Job {job_id}: Added to queue")
     return job
 
 
-@app.get("/jobs", response_model=List[Job])
+@app.get("/jobs", response_model=List[JobSummary])
 async def list_jobs():
-    async with jobs_lock:
-        return list(jobs.values())
+    return await job_store.summaries()
 
 
 @app.get("/jobs/{job_id}", response_model=Job)
 async def get_job(job_id: str):
-    async with jobs_lock:
-        job = jobs.get(job_id)
+    job = await job_store.get(job_id)
     if not job:
         logger.warning(f"Job {job_id}: Not found")
         raise HTTPException(status_code=404, detail="Job not found")
@@ -219,8 +768,7 @@ async def get_job(job_id: str):
 
 @app.get("/jobs/{job_id}/video")
 async def download_video(job_id: str):
-    async with jobs_lock:
-        job = jobs.get(job_id)
+    job = await job_store.get(job_id)
     if not job:
         logger.warning(f"Job {job_id}: Video download requested but job not found")
         raise HTTPException(status_code=404, detail="Job not found")
@@ -228,11 +776,22 @@ async def download_video(job_id: str):
         logger.warning(f"Job {job_id}: Video download requested but job not completed (status: {job.status})")
         raise HTTPException(status_code=409, detail="Job not completed")
     video_path = Path(job.output_path)
-    if not video_path.exists():
+    try:
+        stat_result = video_path.stat()
+    except FileNotFoundError:
         logger.error(f"Job {job_id}: Video file missing at {video_path}")
         raise HTTPException(status_code=410, detail="Video expired")
+    if ACCEL_REDIRECT_PREFIX:
+        logger.info(f"Job {job_id}: Handing video file {video_path.name} to the proxy")
+        return Response(
+            media_type="video/mp4",
+            headers={
+                "X-Accel-Redirect": f"{ACCEL_REDIRECT_PREFIX.rstrip('/')}/{video_path.name}",
+                "Content-Disposition": f'attachment; filename="{video_path.name}"',
+            },
+        )
     logger.info(f"Job {job_id}: Serving video file {video_path.name}")
-    return FileResponse(video_path, media_type="video/mp4", filename=video_path.name)
+    return FileResponse(video_path, media_type="video/mp4", filename=video_path.name, stat_result=stat_result)
 
 
 @app.get("/")
@@ -246,5 +805,15 @@ async def root():
 async def health_check():
     """Health check endpoint for monitoring"""
     logger.debug("Health check requested")
-    return {"status": "healthy", "jobs_count": len(jobs), "output_dir": str(OUTPUT_DIR)}
+    return {
+        "status": "healthy",
+        "job_store": "redis" if REDIS_URL else "memory",
+        "jobs_count": await job_store.count(),
+        "output_dir": str(OUTPUT_DIR),
+        "renderers": ["cairo", "opengl"] if OPENGL_AVAILABLE else ["cairo"],
+        "render_workers": len(render_workers),
+        "active_jobs": len(active_jobs),
+        "available_render_slots": len(render_workers) - len(active_jobs),
+        "queued_jobs": await job_store.queue_size(),
+    }
 
@@ -0,0 +1,146 @@
+"""Pre-warmed Manim render driver.
+
+Imports manim once, then reads one JSON render request per line from stdin. Each
+request is rendered in a forked child so scenes never share interpreter state, while
+the import cost is paid only when the driver starts.
+
+If stdin closes while a render is running (the API process went away), the driver kills
+the render's process group before exiting, so renders never outlive their caller.
+
+Protocol (one JSON object per line):
+    <- {"ready": true, "modules": [<top-level modules imported at startup>]}
+    -> {"args": [...], "cwd": "...", "env": {...}, "stdout": "<path>", "stderr": "<path>"}
+    <- {"pid": <child pid>}
+    <- {"returncode": <exit code>}
+"""
+import json
+import os
+import select
+import signal
+import sys
+import time
+import traceback
+from typing import Optional
+
+# Keep the protocol on a private fd so nothing printed during import (or by a
+# misbehaving library) can corrupt it; stray driver output goes to stderr instead.
+protocol = os.fdopen(os.dup(1), "w", buffering=1)
+os.dup2(2, 1)
+
+from manim.__main__ import main as manim_main  # noqa: E402
+
+KILL_GRACE_SECONDS = 2
+_stdin_buffer = b""
+
+
+def send(message: dict) -> None:
+    protocol.write(json.dumps(message) + "\n")
+    protocol.flush()
+
+
+def read_request() -> Optional[dict]:
+    """Next request from stdin, or None once stdin is closed."""
+    global _stdin_buffer
+    while b"\n" not in _stdin_buffer:
+        chunk = os.read(0, 65536)
+        if not chunk:
+            return None
+        _stdin_buffer += chunk
+    line, _stdin_buffer = _stdin_buffer.split(b"\n", 1)
+    return json.loads(line)
+
+
+def kill_group(pid: int) -> int:
+    """SIGTERM the render's process group, SIGKILL it after a grace period, and reap it."""
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(pid, sig)
+        except ProcessLookupError:
+            pass
+        deadline = time.monotonic() + KILL_GRACE_SECONDS
+        while time.monotonic() < deadline:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                return os.waitstatus_to_exitcode(status)
+            time.sleep(0.05)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def wait_for_render(pid: int) -> int:
+    """Wait for the child to exit while watching stdin for the API process going away."""
+    global _stdin_buffer
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    try:
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                return os.waitstatus_to_exitcode(status)
+            watched = [0] if pidfd is None else [0, pidfd]
+            readable, _, _ = select.select(watched, [], [], None if pidfd is not None else 0.1)
+            if 0 in readable:
+                chunk = os.read(0, 65536)
+                if not chunk:
+                    kill_group(pid)
+                    sys.exit(0)
+                _stdin_buffer += chunk
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def render(request: dict) -> int:
+    os.setsid()
+    protocol.close()
+    os.chdir(request["cwd"])
+    os.environ.update(request["env"])
+    sys.path[:0] = [path for path in request["env"].get("PYTHONPATH", "").split(os.pathsep) if path]
+
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    for fd, log_path in ((1, request["stdout"]), (2, request["stderr"])):
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.dup2(log_fd, fd)
+        os.close(log_fd)
+
+    sys.argv = ["manim", *request["args"]]
+    try:
+        manim_main(args=request["args"], prog_name="manim")
+        return 0
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    except BaseException:  # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+        return 1
+
+
+def main() -> None:
+    # Forked renders inherit these already-imported modules; the API renders jobs whose
+    # packages would shadow one of them in a fresh interpreter instead.
+    send({"ready": True, "modules": sorted({name.split(".", 1)[0] for name in sys.modules})})
+    while True:
+        request = read_request()
+        if request is None:
+            return
+        pid = os.fork()
+        if pid == 0:
+            returncode = 1
+            try:
+                returncode = render(request)
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(returncode)
+        send({"pid": pid})
+        send({"returncode": wait_for_render(pid)})
+
+
+if __name__ == "__main__":
+    main()
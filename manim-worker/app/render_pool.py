@@ -0,0 +1,142 @@
+"""Pool of pre-warmed render drivers (app/render_driver.py) and the process-group kill they share."""
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+RENDER_DRIVER_PATH = Path(__file__).with_name("render_driver.py")
+RENDER_KILL_GRACE_SECONDS = 2
+
+
+async def kill_process_group(pid: int) -> None:
+    """SIGTERM a render's process group, then SIGKILL it if it outlives the grace period."""
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(pid, sig)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + RENDER_KILL_GRACE_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                os.killpg(pid, 0)
+            except ProcessLookupError:
+                return
+            await asyncio.sleep(0.05)
+
+
+class RenderDriver:
+    """A long-lived interpreter with manim already imported; see render_driver.py."""
+
+    def __init__(self, driver_id: int, env: Dict[str, str]):
+        self.driver_id = driver_id
+        self.env = env
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.modules: Set[str] = set()
+
+    async def start(self) -> None:
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(RENDER_DRIVER_PATH),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=self.env,
+        )
+        ready = await self._receive()
+        self.modules = set(ready.get("modules", ()))
+        logger.info(f"Render driver {self.driver_id}: Ready (pid {self.process.pid})")
+
+    async def stop(self) -> None:
+        """Close the driver's stdin so it kills any render in flight and exits; kill it if it lingers."""
+        if self.process and self.process.returncode is None:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), 2 * RENDER_KILL_GRACE_SECONDS + 1)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        self.process = None
+
+    async def _receive(self) -> dict:
+        line = await self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Render driver {self.driver_id} exited unexpectedly")
+        return json.loads(line)
+
+    async def _kill_render(self, pid: int) -> None:
+        """Terminate the render's whole process group (manim plus its ffmpeg children)."""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(pid, sig)
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(self._receive(), RENDER_KILL_GRACE_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                continue
+        # Even SIGKILL went unreported, so the driver itself is stuck; replace it.
+        logger.error(f"Render driver {self.driver_id}: No exit report for render {pid}, restarting the driver")
+        await self.stop()
+
+    async def render(self, spec: dict, timeout: float) -> int:
+        """Render spec and return manim's exit code; raises asyncio.TimeoutError after killing it."""
+        if self.process is None or self.process.returncode is not None:
+            await self.start()
+        pid: Optional[int] = None
+        try:
+            self.process.stdin.write(json.dumps(spec).encode("utf-8") + b"\n")
+            await self.process.stdin.drain()
+            pid = (await self._receive())["pid"]
+            try:
+                return (await asyncio.wait_for(self._receive(), timeout))["returncode"]
+            except asyncio.TimeoutError:
+                await self._kill_render(pid)
+                raise
+        except asyncio.TimeoutError:
+            raise
+        except BaseException:
+            # Cancelled or the protocol broke: the render is its own session, so killing the
+            # driver alone would leave it (and its ffmpeg children) running.
+            if pid is not None:
+                await kill_process_group(pid)
+            await self.stop()
+            raise
+
+
+class RenderPool:
+    """Hands each render to an idle pre-warmed driver."""
+
+    def __init__(self, size: int, env: Dict[str, str]):
+        self.drivers = [RenderDriver(driver_id, env) for driver_id in range(size)]
+        self._idle: Optional[asyncio.Queue] = None
+
+    async def start(self) -> None:
+        self._idle = asyncio.Queue()
+        results = await asyncio.gather(*(driver.start() for driver in self.drivers), return_exceptions=True)
+        for driver, result in zip(self.drivers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Render driver {driver.driver_id}: Failed to start, will retry on first job - {result}")
+                await driver.stop()
+            self._idle.put_nowait(driver)
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(driver.stop() for driver in self.drivers))
+
+    @property
+    def preloaded_modules(self) -> Set[str]:
+        """Top-level modules already imported in the drivers, and so in every forked render."""
+        return set().union(*(driver.modules for driver in self.drivers))
+
+    async def submit(self, spec: dict, timeout: float) -> int:
+        driver = await self._idle.get()
+        try:
+            return await driver.render(spec, timeout)
+        finally:
+            self._idle.put_nowait(driver)
@@ -0,0 +1,36 @@
+"""Cheap static checks applied to submitted scene code before it is queued."""
+import ast
+
+# Modules a scene has no business importing; rejected up front as a cheap safety filter.
+BLOCKED_MODULES = {"ctypes", "multiprocessing", "pty", "socket", "subprocess"}
+
+
+def check_scene_code(code: str) -> None:
+    """Reject code that cannot compile or is obviously unsafe before it takes a render slot."""
+    try:
+        tree = ast.parse(code, filename="scene.py")
+        compile(tree, "scene.py", "exec")
+    except SyntaxError as exc:
+        raise ValueError(f"invalid Python: {exc.msg} (line {exc.lineno})") from exc
+    except (ValueError, RecursionError, MemoryError) as exc:
+        # Null bytes raise ValueError; pathologically deep expressions exhaust the parser.
+        raise ValueError("invalid Python: code is too deeply nested or malformed") from exc
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or ""]
+        elif isinstance(node, ast.While):
+            if (
+                isinstance(node.test, ast.Constant)
+                and node.test.value
+                and not any(isinstance(child, (ast.Break, ast.Return, ast.Raise)) for child in ast.walk(node))
+            ):
+                raise ValueError(f"infinite loop without break (line {node.lineno})")
+            continue
+        else:
+            continue
+        for module in modules:
+            if module.split(".", 1)[0] in BLOCKED_MODULES:
+                raise ValueError(f"import of '{module}' is not allowed (line {node.lineno})")
@@ -0,0 +1,104 @@
+import errno
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.files import copy_video, move_video
+
+REAL_COPY_FILE_RANGE = getattr(os, "copy_file_range", None)
+REAL_SENDFILE = getattr(os, "sendfile", None)
+
+
+def raising(err):
+    def copy(*args):
+        raise OSError(err, os.strerror(err))
+
+    return copy
+
+
+class CopyVideoTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.data = os.urandom(3 * 1024 * 1024 + 123)
+        self.source = self.dir / "source.mp4"
+        self.source.write_bytes(self.data)
+        self.destination = self.dir / "destination.mp4"
+
+    def assertCopied(self):
+        self.assertEqual(self.destination.read_bytes(), self.data)
+
+    @unittest.skipUnless(REAL_COPY_FILE_RANGE and REAL_SENDFILE, "needs copy_file_range and sendfile")
+    def test_copy_file_range_failing_partway_resumes_with_sendfile(self):
+        def copy_first_megabyte(src_fd, dst_fd, count):
+            if os.lseek(src_fd, 0, os.SEEK_CUR) >= 1024 * 1024:
+                raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+            return REAL_COPY_FILE_RANGE(src_fd, dst_fd, min(count, 256 * 1024))
+
+        sendfile = mock.Mock(side_effect=REAL_SENDFILE)
+        with mock.patch("os.copy_file_range", copy_first_megabyte, create=True), mock.patch("os.sendfile", sendfile):
+            copy_video(self.source, self.destination)
+        self.assertCopied()
+        self.assertTrue(sendfile.called)
+
+    def test_user_space_copy_when_nothing_in_kernel_is_supported(self):
+        copyfileobj = mock.Mock(side_effect=shutil.copyfileobj)
+        with mock.patch("os.copy_file_range", raising(errno.ENOSYS), create=True), mock.patch(
+            "os.sendfile", raising(errno.EINVAL), create=True
+        ), mock.patch("app.files.shutil.copyfileobj", copyfileobj):
+            copy_video(self.source, self.destination)
+        self.assertCopied()
+        self.assertTrue(copyfileobj.called)
+
+    def test_other_errors_are_raised(self):
+        with mock.patch("os.copy_file_range", raising(errno.EIO), create=True):
+            with self.assertRaises(OSError):
+                copy_video(self.source, self.destination)
+
+    def test_empty_file(self):
+        self.source.write_bytes(b"")
+        self.data = b""
+        copy_video(self.source, self.destination)
+        self.assertCopied()
+
+
+class MoveVideoTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.data = os.urandom(5 * 1024 * 1024)
+
+    def test_same_filesystem_is_renamed(self):
+        source, destination = self.dir / "a.mp4", self.dir / "b.mp4"
+        source.write_bytes(self.data)
+        move_video(source, destination)
+        self.assertFalse(source.exists())
+        self.assertEqual(destination.read_bytes(), self.data)
+
+    def test_cross_device_rename_falls_back_to_copy(self):
+        source, destination = self.dir / "a.mp4", self.dir / "b.mp4"
+        source.write_bytes(self.data)
+        with mock.patch("os.replace", raising(errno.EXDEV)):
+            move_video(source, destination)
+        self.assertEqual(destination.read_bytes(), self.data)
+
+    def test_tmpfs_to_disk(self):
+        if not os.path.isdir("/dev/shm"):
+            self.skipTest("no /dev/shm")
+        shm_dir = Path(tempfile.mkdtemp(dir="/dev/shm"))
+        self.addCleanup(shutil.rmtree, shm_dir, True)
+        disk_dir = Path(tempfile.mkdtemp(dir=Path(__file__).parent))
+        self.addCleanup(shutil.rmtree, disk_dir, True)
+        if os.stat(shm_dir).st_dev == os.stat(disk_dir).st_dev:
+            self.skipTest("/dev/shm and the tests dir share a filesystem")
+        source, destination = shm_dir / "a.mp4", disk_dir / "b.mp4"
+        source.write_bytes(self.data)
+        move_video(source, destination)
+        self.assertEqual(destination.read_bytes(), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
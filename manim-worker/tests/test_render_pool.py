@@ -0,0 +1,157 @@
+import asyncio
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.render_pool import RenderDriver, RenderPool
+
+# Stands in for manim: the first CLI argument picks what the "render" does.
+STUB_MANIM_MAIN = """
+import os
+import subprocess
+import sys
+import time
+
+
+def main(args, prog_name):
+    if args[0] == "ok":
+        print("rendered", os.environ["JOB_MARKER"])
+    elif args[0] == "fail":
+        sys.exit(3)
+    elif args[0] == "hang":
+        child = subprocess.Popen(["sleep", "60"])
+        with open("pids.tmp", "w") as pids:
+            pids.write(f"{os.getpid()} {child.pid}")
+        os.rename("pids.tmp", "pids")
+        time.sleep(60)
+"""
+
+
+def process_alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "render driver relies on Linux process handling")
+class RenderDriverTests(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.stub_dir = Path(tempfile.mkdtemp())
+        (cls.stub_dir / "manim").mkdir()
+        (cls.stub_dir / "manim" / "__init__.py").write_text("")
+        (cls.stub_dir / "manim" / "__main__.py").write_text(STUB_MANIM_MAIN)
+        cls.env = {**os.environ, "PYTHONPATH": str(cls.stub_dir)}
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.stub_dir, True)
+
+    async def asyncSetUp(self):
+        self.work_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        self.driver = RenderDriver(0, self.env)
+        await self.driver.start()
+        self.addAsyncCleanup(self.driver.stop)
+
+    def spec(self, action: str) -> dict:
+        return {
+            "args": [action],
+            "cwd": str(self.work_dir),
+            "env": {"JOB_MARKER": "job-1"},
+            "stdout": str(self.work_dir / "stdout.log"),
+            "stderr": str(self.work_dir / "stderr.log"),
+        }
+
+    async def render_pids(self):
+        pids_path = self.work_dir / "pids"
+        for _ in range(200):
+            if pids_path.exists():
+                return [int(pid) for pid in pids_path.read_text().split()]
+            await asyncio.sleep(0.05)
+        self.fail("render never started")
+
+    def assertAllDead(self, pids):
+        for pid in pids:
+            self.assertFalse(process_alive(pid), f"process {pid} outlived its render")
+
+    async def test_success_writes_logs(self):
+        self.assertEqual(await self.driver.render(self.spec("ok"), 30), 0)
+        self.assertEqual((self.work_dir / "stdout.log").read_text(), "rendered job-1\n")
+        self.assertIn("manim", self.driver.modules)
+
+    async def test_nonzero_exit_code(self):
+        self.assertEqual(await self.driver.render(self.spec("fail"), 30), 3)
+        self.assertEqual(await self.driver.render(self.spec("ok"), 30), 0)
+
+    async def test_timeout_kills_render_group(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.driver.render(self.spec("hang"), 1)
+        self.assertAllDead(await self.render_pids())
+        # The driver itself survives and takes the next job.
+        self.assertEqual(await self.driver.render(self.spec("ok"), 30), 0)
+
+    async def test_cancellation_kills_render_group_and_driver(self):
+        render = asyncio.create_task(self.driver.render(self.spec("hang"), 60))
+        pids = await self.render_pids()
+        render.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await render
+        self.assertAllDead(pids)
+        self.assertIsNone(self.driver.process)
+        self.assertEqual(await self.driver.render(self.spec("ok"), 30), 0)
+
+    async def test_stop_mid_render_kills_render_group(self):
+        render = asyncio.create_task(self.driver.render(self.spec("hang"), 60))
+        pids = await self.render_pids()
+        driver_pid = self.driver.process.pid
+        await self.driver.stop()
+        render.cancel()
+        await asyncio.gather(render, return_exceptions=True)
+        self.assertAllDead([driver_pid, *pids])
+
+    async def test_unresponsive_driver_is_replaced_after_timeout(self):
+        render = asyncio.create_task(self.driver.render(self.spec("hang"), 1))
+        pids = await self.render_pids()
+        driver_pid = self.driver.process.pid
+        os.kill(driver_pid, signal.SIGSTOP)
+        with mock.patch("app.render_pool.RENDER_KILL_GRACE_SECONDS", 0.2), self.assertLogs("app.render_pool", "ERROR"):
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(render, 10)
+        self.assertIsNone(self.driver.process)
+        self.assertAllDead([driver_pid, *pids])
+        self.assertEqual(await self.driver.render(self.spec("ok"), 30), 0)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "render driver relies on Linux process handling")
+class RenderPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def test_submit_and_preloaded_modules(self):
+        stub_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, stub_dir, True)
+        (stub_dir / "manim").mkdir()
+        (stub_dir / "manim" / "__init__.py").write_text("")
+        (stub_dir / "manim" / "__main__.py").write_text(STUB_MANIM_MAIN)
+        pool = RenderPool(2, {**os.environ, "PYTHONPATH": str(stub_dir)})
+        await pool.start()
+        self.addAsyncCleanup(pool.stop)
+        self.assertIn("manim", pool.preloaded_modules)
+        spec = {
+            "args": ["ok"],
+            "cwd": str(stub_dir),
+            "env": {"JOB_MARKER": "pooled"},
+            "stdout": str(stub_dir / "stdout.log"),
+            "stderr": str(stub_dir / "stderr.log"),
+        }
+        results = await asyncio.gather(*(pool.submit(spec, 30) for _ in range(3)))
+        self.assertEqual(results, [0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
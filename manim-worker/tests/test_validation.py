@@ -0,0 +1,45 @@
+import unittest
+
+from app.validation import check_scene_code
+
+
+SCENE = """from manim import *
+
+
+class Demo(Scene):
+    def construct(self):
+        self.play(Create(Circle()))
+"""
+
+
+class CheckSceneCodeTests(unittest.TestCase):
+    def test_accepts_valid_scene(self):
+        check_scene_code(SCENE)
+
+    def test_rejects_syntax_error(self):
+        with self.assertRaisesRegex(ValueError, r"invalid Python: .*\(line 1\)"):
+            check_scene_code("def broken(:\n    pass\n")
+
+    def test_rejects_blocked_import(self):
+        for code in ("import subprocess", "import os, socket", "from ctypes import CDLL", "import multiprocessing.pool"):
+            with self.subTest(code=code), self.assertRaisesRegex(ValueError, "is not allowed"):
+                check_scene_code(code)
+
+    def test_allows_unblocked_import(self):
+        check_scene_code("import numpy as np\nfrom math import pi\n")
+
+    def test_rejects_while_true_without_break(self):
+        with self.assertRaisesRegex(ValueError, r"infinite loop without break \(line 2\)"):
+            check_scene_code("x = 0\nwhile True:\n    x += 1\n")
+
+    def test_allows_while_true_with_break(self):
+        check_scene_code("x = 0\nwhile True:\n    x += 1\n    if x > 10:\n        break\n")
+
+    def test_rejects_deep_nesting_as_value_error(self):
+        for code in ("x = " + "+".join(["1"] * 24000), "x = " + "-" * 49000 + "1"):
+            with self.subTest(length=len(code)), self.assertRaisesRegex(ValueError, "invalid Python"):
+                check_scene_code(code)
+
+
+if __name__ == "__main__":
+    unittest.main()